@@ -113,6 +113,41 @@ export interface PipelineErrorContext extends Record<string, unknown> {
   [key: string]: unknown;
 }
 
+// ============================================================================
+// CONTEXT SANITIZATION
+// ============================================================================
+
+/**
+ * Sensitive context key patterns redacted by PipelineError.toJSON()
+ *
+ * @remarks
+ * Lowercase for case-insensitive matching. Defined once at module load
+ * rather than rebuilt on every sanitization call.
+ */
+const SENSITIVE_CONTEXT_KEYS: readonly string[] = [
+  'apikey',
+  'apisecret',
+  'api_key',
+  'api_secret',
+  'token',
+  'accesstoken',
+  'refreshtoken',
+  'authtoken',
+  'bearertoken',
+  'idtoken',
+  'sessiontoken',
+  'password',
+  'passwd',
+  'secret',
+  'privatekey',
+  'private',
+  'email',
+  'emailaddress',
+  'phonenumber',
+  'ssn',
+  'authorization',
+];
+
 // ============================================================================
 // PIPELINE ERROR BASE CLASS
 // ============================================================================
@@ -161,13 +196,31 @@ export abstract class PipelineError extends Error {
    */
   readonly context?: PipelineErrorContext;
 
+  // Internal state uses ES private fields so context keys copied onto the
+  // instance by the constructor cannot clobber it.
+
   /**
-   * Timestamp when error was created
+   * Epoch milliseconds when error was created
    *
    * @remarks
-   * ISO 8601 timestamp for error tracking and monitoring.
+   * Stored as a number so constructing an error does not allocate a Date.
+   * The Date is materialized on first access of {@link timestamp}.
+   */
+  readonly #createdAt: number;
+
+  /**
+   * Cached Date for the timestamp getter
    */
-  readonly timestamp: Date;
+  #timestampDate?: Date;
+
+  /**
+   * Cached toJSON() result
+   *
+   * @remarks
+   * Frozen snapshot built on the first toJSON() call and reused by every
+   * subsequent call.
+   */
+  #serialized?: Readonly<Record<string, unknown>>;
 
   /**
    * Creates a new PipelineError
@@ -185,7 +238,8 @@ export abstract class PipelineError extends Error {
     super(message);
 
     // CRITICAL: Set prototype for instanceof to work correctly
-    // ES5 target requires this, but it's best practice even for ES2022
+    // ES5 target requires this, but it's best practice even for ES2022.
+    // new.target is the concrete subclass, so subclasses need not repeat this.
     Object.setPrototypeOf(this, new.target.prototype);
 
     // CRITICAL: Capture stack trace (V8/Node.js only)
@@ -196,12 +250,23 @@ export abstract class PipelineError extends Error {
 
     this.name = this.constructor.name;
     this.context = context;
-    this.timestamp = new Date();
+    this.#createdAt = Date.now();
 
     // CRITICAL: Attach context properties directly to error instance for easy access
     // This allows tests to access properties like error.variable, error.taskId, etc.
     if (context) {
-      Object.assign(this, context);
+      if (Object.hasOwn(context, 'timestamp')) {
+        // timestamp is a getter-only accessor, so assigning through it would
+        // throw; shadow it with a read-only own property holding the value
+        const { timestamp, ...rest } = context;
+        Object.assign(this, rest);
+        Object.defineProperty(this, 'timestamp', {
+          value: timestamp,
+          enumerable: true,
+        });
+      } else {
+        Object.assign(this, context);
+      }
     }
 
     // Store cause if provided (ES2022+)
@@ -211,6 +276,22 @@ export abstract class PipelineError extends Error {
     }
   }
 
+  /**
+   * Timestamp when error was created
+   *
+   * @remarks
+   * ISO 8601 timestamp for error tracking and monitoring.
+   * Created lazily and cached, so repeated reads return the same Date.
+   * A `timestamp` key in the context object shadows this value, but
+   * toJSON() always reports the creation time.
+   */
+  get timestamp(): Date {
+    if (this.#timestampDate === undefined) {
+      this.#timestampDate = new Date(this.#createdAt);
+    }
+    return this.#timestampDate;
+  }
+
   /**
    * Serialize error for structured logging
    *
@@ -218,6 +299,12 @@ export abstract class PipelineError extends Error {
    * Returns a plain object compatible with JSON.stringify and pino logger.
    * Handles circular references and sanitizes sensitive data.
    *
+   * The result is a snapshot taken on the first call, then cached and
+   * returned by every later call. Object and array context values are
+   * stored as detached JSON copies, and the top-level object and its
+   * context are frozen, so later changes to the caller's context are not
+   * reflected. Nested copies are not frozen; treat them as read-only.
+   *
    * Output includes:
    * - name: Error class name
    * - code: Error code for programmatic handling
@@ -240,17 +327,21 @@ export abstract class PipelineError extends Error {
    * }
    * ```
    */
-  toJSON(): Record<string, unknown> {
+  toJSON(): Readonly<Record<string, unknown>> {
+    if (this.#serialized) {
+      return this.#serialized;
+    }
+
     const serialized: Record<string, unknown> = {
       name: this.name,
       code: this.code,
       message: this.message,
-      timestamp: this.timestamp.toISOString(),
+      timestamp: new Date(this.#createdAt).toISOString(),
     };
 
     // Add context if present (with sanitization)
     if (this.context) {
-      serialized.context = this.sanitizeContext(this.context);
+      serialized.context = Object.freeze(this.sanitizeContext(this.context));
     }
 
     // Add stack trace (inherited from Error.prototype)
@@ -258,7 +349,8 @@ export abstract class PipelineError extends Error {
       serialized.stack = this.stack;
     }
 
-    return serialized;
+    this.#serialized = Object.freeze(serialized);
+    return this.#serialized;
   }
 
   /**
@@ -283,38 +375,27 @@ export abstract class PipelineError extends Error {
   ): Record<string, unknown> {
     const sanitized: Record<string, unknown> = {};
 
-    // Sensitive key patterns (lowercase for case-insensitive matching)
-    const sensitiveKeys = [
-      'apikey',
-      'apisecret',
-      'api_key',
-      'api_secret',
-      'token',
-      'accesstoken',
-      'refreshtoken',
-      'authtoken',
-      'bearertoken',
-      'idtoken',
-      'sessiontoken',
-      'password',
-      'passwd',
-      'secret',
-      'privatekey',
-      'private',
-      'email',
-      'emailaddress',
-      'phonenumber',
-      'ssn',
-      'authorization',
-    ];
-
     for (const [key, value] of Object.entries(context)) {
       // Check if key is sensitive (case-insensitive)
-      if (sensitiveKeys.some(sk => key.toLowerCase().includes(sk))) {
+      const lowerKey = key.toLowerCase();
+      if (SENSITIVE_CONTEXT_KEYS.some(sk => lowerKey.includes(sk))) {
         sanitized[key] = '[REDACTED]';
         continue;
       }
 
+      // Fast path: primitives are always serializable, so skip the
+      // instanceof check and the JSON.stringify probe below
+      const valueType = typeof value;
+      if (
+        value == null ||
+        valueType === 'string' ||
+        valueType === 'number' ||
+        valueType === 'boolean'
+      ) {
+        sanitized[key] = value;
+        continue;
+      }
+
       // Handle nested errors
       if (value instanceof Error) {
         sanitized[key] = {
@@ -330,10 +411,12 @@ export abstract class PipelineError extends Error {
         continue;
       }
 
-      // Handle circular references and other non-serializable objects
+      // Handle circular references and other non-serializable objects.
+      // Store a detached copy so the cached snapshot does not share
+      // references with the caller's context.
       try {
-        JSON.stringify(value);
-        sanitized[key] = value;
+        const probe = JSON.stringify(value);
+        sanitized[key] = probe === undefined ? value : JSON.parse(probe);
       } catch {
         sanitized[key] = '[non-serializable]';
       }
@@ -364,12 +447,6 @@ export abstract class PipelineError extends Error {
 export class SessionError extends PipelineError {
   readonly code = ErrorCodes.PIPELINE_SESSION_LOAD_FAILED;
 
-  constructor(message: string, context?: PipelineErrorContext, cause?: Error) {
-    super(message, context, cause);
-    // Ensure prototype is set for this class
-    Object.setPrototypeOf(this, SessionError.prototype);
-  }
-
   /**
    * Check if this is a session load error
    *
@@ -397,11 +474,6 @@ export class SessionError extends PipelineError {
  */
 export class TaskError extends PipelineError {
   readonly code = ErrorCodes.PIPELINE_TASK_EXECUTION_FAILED;
-
-  constructor(message: string, context?: PipelineErrorContext, cause?: Error) {
-    super(message, context, cause);
-    Object.setPrototypeOf(this, TaskError.prototype);
-  }
 }
 
 /**
@@ -421,11 +493,6 @@ export class TaskError extends PipelineError {
  */
 export class AgentError extends PipelineError {
   readonly code = ErrorCodes.PIPELINE_AGENT_LLM_FAILED;
-
-  constructor(message: string, context?: PipelineErrorContext, cause?: Error) {
-    super(message, context, cause);
-    Object.setPrototypeOf(this, AgentError.prototype);
-  }
 }
 
 /**
@@ -467,7 +534,6 @@ export class ValidationError extends PipelineError {
     }
 
     super(message, context, cause);
-    Object.setPrototypeOf(this, ValidationError.prototype);
     this.code = errorCode;
   }
 }
@@ -494,12 +560,6 @@ export class ValidationError extends PipelineError {
  */
 export class BugfixSessionValidationError extends PipelineError {
   readonly code = ErrorCodes.PIPELINE_SESSION_INVALID_BUGFIX_PATH;
-
-  constructor(message: string, context?: PipelineErrorContext, cause?: Error) {
-    super(message, context, cause);
-    // CRITICAL: Must set prototype for this class explicitly
-    Object.setPrototypeOf(this, BugfixSessionValidationError.prototype);
-  }
 }
 
 /**
@@ -532,8 +592,6 @@ export class NestedExecutionError extends PipelineError {
     cause?: Error
   ) {
     super(message, context, cause);
-    // CRITICAL: Must set prototype for this class explicitly
-    Object.setPrototypeOf(this, NestedExecutionError.prototype);
   }
 }
 
@@ -554,11 +612,6 @@ export class NestedExecutionError extends PipelineError {
  */
 export class EnvironmentError extends PipelineError {
   readonly code = ErrorCodes.PIPELINE_VALIDATION_INVALID_INPUT;
-
-  constructor(message: string, context?: PipelineErrorContext, cause?: Error) {
-    super(message, context, cause);
-    Object.setPrototypeOf(this, EnvironmentError.prototype);
-  }
 }
 
 // ============================================================================
@@ -779,40 +832,33 @@ export function isFatalError(
     return false;
   }
 
-  // Non-object errors are non-fatal
-  if (error == null || typeof error !== 'object') {
+  // Only PipelineError subclasses can be fatal. instanceof also rejects
+  // null, undefined and other non-object values.
+  if (!isPipelineError(error)) {
     return false;
   }
 
-  // Check for PipelineError instances using type guard
-  if (isPipelineError(error)) {
-    // FATAL: All EnvironmentError instances
-    if (isEnvironmentError(error)) {
-      return true;
-    }
-
-    // FATAL: SessionError with LOAD_FAILED or SAVE_FAILED codes
-    if (isSessionError(error)) {
-      return (
-        error.code === ErrorCodes.PIPELINE_SESSION_LOAD_FAILED ||
-        error.code === ErrorCodes.PIPELINE_SESSION_SAVE_FAILED
-      );
-    }
+  // FATAL: All EnvironmentError instances
+  if (isEnvironmentError(error)) {
+    return true;
+  }
 
-    // FATAL: ValidationError for parse_prd operation with INVALID_INPUT code
-    if (isValidationError(error)) {
-      return (
-        error.code === ErrorCodes.PIPELINE_VALIDATION_INVALID_INPUT &&
-        error.context?.operation === 'parse_prd'
-      );
-    }
+  // FATAL: SessionError with LOAD_FAILED or SAVE_FAILED codes
+  if (isSessionError(error)) {
+    return (
+      error.code === ErrorCodes.PIPELINE_SESSION_LOAD_FAILED ||
+      error.code === ErrorCodes.PIPELINE_SESSION_SAVE_FAILED
+    );
+  }
 
-    // NON-FATAL: TaskError and AgentError are individual failures
-    if (isTaskError(error) || isAgentError(error)) {
-      return false;
-    }
+  // FATAL: ValidationError for parse_prd operation with INVALID_INPUT code
+  if (isValidationError(error)) {
+    return (
+      error.code === ErrorCodes.PIPELINE_VALIDATION_INVALID_INPUT &&
+      error.context?.operation === 'parse_prd'
+    );
   }
 
-  // Default: non-fatal for unknown error types
+  // NON-FATAL: TaskError, AgentError and all other PipelineError types
   return false;
 }
@@ -138,8 +138,6 @@ export class LinkValidationError extends PipelineError {
     super(message, context, cause);
     this.name = 'LinkValidationError';
     this.code = errorCode as ErrorCode;
-    // Ensure prototype is set for this class
-    Object.setPrototypeOf(this, LinkValidationError.prototype);
   }
 }
 
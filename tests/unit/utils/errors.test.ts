@@ -188,6 +188,41 @@ describe('Error hierarchy', () => {
       expect(error.timestamp.getTime()).toBeLessThanOrEqual(after.getTime());
     });
 
+    it('should return the same timestamp on repeated access', () => {
+      const error = new SessionError('Test error');
+      expect(error.timestamp).toBe(error.timestamp);
+      expect(error.toJSON().timestamp).toBe(error.timestamp.toISOString());
+    });
+
+    it('should not allow timestamp to be reassigned', () => {
+      const error = new SessionError('Test error');
+      const originalTimestamp = error.timestamp;
+
+      expect(() => {
+        // @ts-expect-error - Testing that timestamp is readonly
+        error.timestamp = new Date(0);
+      }).toThrow(TypeError);
+      expect(error.timestamp).toBe(originalTimestamp);
+    });
+
+    it('should let a context timestamp key shadow the creation time', () => {
+      const before = Date.now();
+      const zero = new SessionError('Test error', { timestamp: 0 });
+      const empty = new SessionError('Test error', { timestamp: null });
+
+      expect(zero.timestamp).toBe(0);
+      expect(empty.timestamp).toBeNull();
+      expect(() => {
+        // @ts-expect-error - Testing that timestamp is readonly
+        zero.timestamp = new Date();
+      }).toThrow(TypeError);
+
+      const json = zero.toJSON();
+      expect(Date.parse(json.timestamp as string)).toBeGreaterThanOrEqual(
+        before
+      );
+    });
+
     it('should have name property set to class name', () => {
       const sessionError = new SessionError('Test');
       const taskError = new TaskError('Test');
@@ -319,6 +354,52 @@ describe('Error hierarchy', () => {
       expect(parsed.name).toBe('SessionError');
       expect(parsed.code).toBe(ErrorCodes.PIPELINE_SESSION_LOAD_FAILED);
     });
+
+    it('should reuse the serialized object on repeated calls', () => {
+      const error = new SessionError('Test error', { taskId: 'P1.M1.T1' });
+
+      expect(error.toJSON()).toBe(error.toJSON());
+      expect(JSON.parse(JSON.stringify(error))).toEqual(error.toJSON());
+    });
+
+    it('should return a frozen snapshot', () => {
+      const context: PipelineErrorContext = { taskId: 'P1.M1.T1' };
+      const error = new SessionError('Test error', context);
+      const json = error.toJSON();
+
+      expect(Object.isFrozen(json)).toBe(true);
+      expect(Object.isFrozen(json.context)).toBe(true);
+      expect(() => {
+        delete (json as Record<string, unknown>).stack;
+      }).toThrow(TypeError);
+
+      context.taskId = 'P9.M9.T9';
+      expect(error.toJSON().context).toEqual({ taskId: 'P1.M1.T1' });
+    });
+
+    it('should detach nested context values from the snapshot', () => {
+      const nested = { a: 1 };
+      const cyclePath = ['P1.M1.T1', 'P1.M1.T2'];
+      const error = new ValidationError('Cycle detected', {
+        nested,
+        cyclePath,
+      });
+      const json = error.toJSON();
+      const jsonContext = json.context as {
+        nested: { a: number };
+        cyclePath: string[];
+      };
+
+      nested.a = 2;
+      cyclePath.push('P1.M1.T3');
+      expect(error.toJSON().context).toEqual({
+        nested: { a: 1 },
+        cyclePath: ['P1.M1.T1', 'P1.M1.T2'],
+      });
+
+      jsonContext.cyclePath.push('P9.M9.T9');
+      expect(cyclePath).toEqual(['P1.M1.T1', 'P1.M1.T2', 'P1.M1.T3']);
+    });
   });
 
   // ========================================================================
@@ -455,6 +536,24 @@ describe('Error hierarchy', () => {
       expect(context?.callback).toBe('[non-serializable]');
     });
 
+    it('should pass primitive values through unchanged', () => {
+      const error = new SessionError('Test error', {
+        attempt: 3,
+        retryable: false,
+        note: 'text',
+        missing: null,
+        big: BigInt(1),
+      });
+      const json = error.toJSON();
+      const context = json.context as Record<string, unknown> | undefined;
+
+      expect(context?.attempt).toBe(3);
+      expect(context?.retryable).toBe(false);
+      expect(context?.note).toBe('text');
+      expect(context?.missing).toBeNull();
+      expect(context?.big).toBe('[non-serializable]');
+    });
+
     it('should redact multiple sensitive fields in same context', () => {
       const error = new SessionError('Test error', {
         apiKey: 'sk-secret',